@@ -4,7 +4,7 @@ Application configuration and settings
 
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -32,6 +32,7 @@ class Settings(BaseSettings):
 
     # PDF processing settings
     max_pdf_pages: int = 30  # Limit pages to process (0 = no limit)
+    pdf_fallback_backend: Literal["pymupdf", "pypdfium2"] = "pymupdf"  # pypdfium2 is Apache/BSD
 
     # Vector DB settings
     vector_db_type: str = "chroma"  # chroma, pinecone, qdrant, weaviate
@@ -43,6 +44,11 @@ class Settings(BaseSettings):
 
     # Embedding settings
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_batch_size: int = 32  # Texts per forward pass when encoding chunks
+    embedding_cache_size: int = 1024  # Query embeddings kept in LRU cache (0 = off)
+    embedding_cache_max_chars: int = 512  # Longer texts rarely repeat; bypass the cache
+    embedding_half_precision: bool = True  # Run the model in float16 when on CUDA
+    embedding_cache_quantization: str = "none"  # "int8" stores cached vectors at 1/4 size
 
     # LLM settings for metadata extraction
     llm_provider: str = "lmstudio"  # "lmstudio" (local) or "openai"
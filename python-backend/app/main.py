@@ -53,6 +53,7 @@ This service provides:
 - `/documents/chunk` - Parse and chunk without storing
 - `/search/` - Semantic search across stored documents
 - `/health` - Service health check
+- `/metrics` - Prometheus metrics
         """,
         lifespan=lifespan,
         docs_url="/docs",
@@ -0,0 +1,79 @@
+"""
+Prometheus metrics for the document processing service
+Exposed at /metrics by the health router
+
+Counters are per process: with several uvicorn workers, each scrape sees
+only the worker that answered it.
+"""
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+PARSE_DURATION = Histogram(
+    "parse_duration_seconds",
+    "Time spent parsing a document",
+    ["method"],  # extraction_method: docling, pymupdf, pypdfium2, plaintext
+    buckets=(0.01, 0.1, 0.5, 1, 5, 30),
+)
+
+PARSE_BYTES = Counter(
+    "parse_bytes_total",
+    "Bytes of documents parsed",
+    ["method"],
+)
+
+
+# (metric name, get_metrics() key, help text) for the embedder's plain counters
+_EMBEDDER_COUNTERS = (
+    ("embedding_cache_hits", "total_cache_hits", "Query embedding cache hits"),
+    ("embedding_cache_misses", "total_cache_misses", "Query embedding cache misses"),
+    ("embedding_cache_evictions", "eviction_count", "LRU evictions from the cache"),
+    ("embedding_dedup_savings", "total_dedup_savings", "Repeated texts skipped in batches"),
+    (
+        "embedding_coalesced_requests",
+        "coalesced_requests",
+        "Queries that waited on an identical in-flight encode",
+    ),
+)
+
+
+class EmbedderMetricsCollector:
+    """Reports EmbedderService.get_metrics() at scrape time"""
+
+    def describe(self):
+        # Declared so registration does not call collect() during import
+        return []
+
+    def collect(self):
+        # Imported lazily: services import this module for the parse metrics
+        from .services.embedder import get_loaded_embedder
+
+        embedder = get_loaded_embedder()
+        if embedder is None:
+            return  # Never load the model just to answer a scrape
+
+        metrics = embedder.get_metrics()
+
+        for name, key, documentation in _EMBEDDER_COUNTERS:
+            yield CounterMetricFamily(name, documentation, value=metrics[key])
+
+        entries = GaugeMetricFamily("embedding_cache_entries", "Entries in the query cache")
+        entries.add_metric([], metrics["cache_entries"])
+        yield entries
+
+        queries = CounterMetricFamily(
+            "embedding_queries", "Query embeddings served", labels=["cache"]
+        )
+        queries.add_metric(["hit"], metrics["cached_query_count"])
+        queries.add_metric(["miss"], metrics["uncached_query_count"])
+        yield queries
+
+        seconds = CounterMetricFamily(
+            "embedding_query_seconds", "Time spent serving query embeddings", labels=["cache"]
+        )
+        seconds.add_metric(["hit"], metrics["cached_latency_sum_ns"] / 1e9)
+        seconds.add_metric(["miss"], metrics["uncached_latency_sum_ns"] / 1e9)
+        yield seconds
+
+
+REGISTRY.register(EmbedderMetricsCollector())
@@ -110,6 +110,21 @@ class VectorSearchResponse(BaseModel):
     search_time_seconds: float
 
 
+class StoredChunk(BaseModel):
+    """A chunk as stored in the vector database"""
+    id: str
+    text: str
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class StoredChunksResponse(BaseModel):
+    """A page of stored chunks"""
+    chunks: List[StoredChunk]
+    count: int
+    limit: int
+    offset: int
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
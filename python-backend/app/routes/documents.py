@@ -2,11 +2,13 @@
 Document processing routes
 """
 
+import asyncio
 import logging
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import orjson
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -16,7 +18,8 @@ from fastapi import (
     Query,
     UploadFile,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from ..config import Settings, get_settings
 from ..models import (
@@ -26,8 +29,15 @@ from ..models import (
     ParsedDocument,
     ProcessingRequest,
     ProcessingResponse,
+    StoredChunksResponse,
+)
+from ..services import (
+    DocumentChunker,
+    DocumentParser,
+    FileTooLargeError,
+    InvalidDocumentError,
+    VectorStoreService,
 )
-from ..services import DocumentChunker, DocumentParser, VectorStoreService
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/documents", tags=["documents"])
@@ -46,6 +56,27 @@ def get_vector_store():
     return VectorStoreService()
 
 
+def _max_upload_bytes(settings: Settings) -> int:
+    return settings.max_file_size_mb * 1024 * 1024
+
+
+def _file_too_large(settings: Settings) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB",
+    )
+
+
+def _ndjson_pages(parser: DocumentParser, temp_path: Path) -> Iterator[bytes]:
+    """Serialize pages as NDJSON lines"""
+    for page in parser.iter_pdf_pages(str(temp_path)):
+        yield orjson.dumps(page) + b"\n"
+
+
+def _remove_temp_file(temp_path: Path):
+    temp_path.unlink(missing_ok=True)
+
+
 @router.post(
     "/upload",
     response_model=ProcessingResponse,
@@ -71,7 +102,7 @@ async def upload_document(
     2. Chunk with LlamaIndex
     3. Optionally store in ChromaDB vector store
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     # Validate file
     if not file.filename:
@@ -86,24 +117,18 @@ async def upload_document(
             detail=f"Unsupported file type: {file_ext}. Supported: {supported}",
         )
 
-    # Check file size
-    file_bytes = await file.read()
-    max_size = settings.max_file_size_mb * 1024 * 1024
-
-    if len(file_bytes) > max_size:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {settings.max_file_size_mb}MB",
-        )
-
     try:
-        # Step 1: Parse document with Docling
+        # Step 1: Parse document with Docling (size limit enforced while streaming)
         logger.info(f"Parsing document: {file.filename}")
-        parsed_doc = parser.parse_bytes(file_bytes, file.filename, settings.upload_dir)
+        parsed_doc = await asyncio.to_thread(
+            parser.parse_stream,
+            file.file, file.filename, settings.upload_dir, _max_upload_bytes(settings)
+        )
 
         # Step 2: Chunk with LlamaIndex
         logger.info(f"Chunking document with strategy: {chunking_strategy}")
-        chunked_doc = chunker.chunk_document(
+        chunked_doc = await asyncio.to_thread(
+            chunker.chunk_document,
             parsed_doc,
             strategy=chunking_strategy,
             chunk_size=chunk_size,
@@ -114,10 +139,12 @@ async def upload_document(
         vector_db_stored = False
         if store_in_vector_db:
             logger.info("Storing chunks in vector DB")
-            vector_store.store_chunks(chunked_doc, collection_name)
+            await asyncio.to_thread(
+                vector_store.store_chunks, chunked_doc, collection_name
+            )
             vector_db_stored = True
 
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         return ProcessingResponse(
             success=True,
@@ -129,6 +156,8 @@ async def upload_document(
             processing_time_seconds=round(processing_time, 3),
         )
 
+    except FileTooLargeError:
+        raise _file_too_large(settings)
     except Exception as e:
         logger.exception(f"Error processing document: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -150,16 +179,109 @@ async def parse_document(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    file_bytes = await file.read()
-
     try:
-        parsed_doc = parser.parse_bytes(file_bytes, file.filename, settings.upload_dir)
+        parsed_doc = await asyncio.to_thread(
+            parser.parse_stream,
+            file.file, file.filename, settings.upload_dir, _max_upload_bytes(settings)
+        )
         return parsed_doc
+    except FileTooLargeError:
+        raise _file_too_large(settings)
     except Exception as e:
         logger.exception(f"Error parsing document: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/parse/text",
+    response_model=ParsedDocument,
+    summary="Extract plain text from a PDF",
+    description="Fast text-only extraction with PyMuPDF; skips Docling layout, table and OCR models",
+)
+async def parse_document_text(
+    file: UploadFile = File(...),
+    settings: Settings = Depends(get_settings),
+    parser: DocumentParser = Depends(get_parser),
+):
+    """Extract text from a PDF without tables, figures or page structure"""
+
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No filename provided")
+
+    if Path(file.filename).suffix.lower() != ".pdf":
+        raise HTTPException(
+            status_code=400, detail="Text-only parsing supports PDF files only"
+        )
+
+    try:
+        parsed_doc = await asyncio.to_thread(
+            parser.parse_stream,
+            file.file,
+            file.filename,
+            settings.upload_dir,
+            _max_upload_bytes(settings),
+            text_only=True,
+        )
+        return parsed_doc
+    except FileTooLargeError:
+        raise _file_too_large(settings)
+    except Exception as e:
+        logger.exception(f"Error parsing document text: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/parse/stream",
+    summary="Stream PDF pages as NDJSON",
+    description="Extract PDF text page by page with PyMuPDF, streaming one JSON object per line",
+)
+async def parse_document_stream(
+    file: UploadFile = File(...),
+    settings: Settings = Depends(get_settings),
+    parser: DocumentParser = Depends(get_parser),
+):
+    """Stream {"page_number", "text"} lines as each page is extracted"""
+
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No filename provided")
+
+    if Path(file.filename).suffix.lower() != ".pdf":
+        raise HTTPException(
+            status_code=400, detail="Streaming parse supports PDF files only"
+        )
+
+    try:
+        temp_path = await asyncio.to_thread(
+            parser.save_stream,
+            file.file, file.filename, settings.upload_dir, _max_upload_bytes(settings)
+        )
+    except FileTooLargeError:
+        raise _file_too_large(settings)
+    except Exception as e:
+        logger.exception(f"Error saving upload: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # Open the PDF before any bytes are sent, so bad uploads still get an error status
+    try:
+        page_count = await asyncio.to_thread(parser.get_pdf_page_count, str(temp_path))
+    except InvalidDocumentError as e:
+        _remove_temp_file(temp_path)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        _remove_temp_file(temp_path)
+        logger.exception(f"Error opening PDF: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # Sync generator: Starlette iterates it in a worker thread. The background
+    # task deletes the temp file even if the client disconnects before page one
+    return StreamingResponse(
+        _ndjson_pages(parser, temp_path),
+        media_type="application/x-ndjson",
+        headers={"X-Page-Count": str(page_count)},
+        background=BackgroundTask(_remove_temp_file, temp_path),
+    )
+
+
 @router.post(
     "/chunk",
     response_model=ChunkedDocument,
@@ -180,17 +302,21 @@ async def chunk_document(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    file_bytes = await file.read()
-
     try:
-        parsed_doc = parser.parse_bytes(file_bytes, file.filename, settings.upload_dir)
-        chunked_doc = chunker.chunk_document(
+        parsed_doc = await asyncio.to_thread(
+            parser.parse_stream,
+            file.file, file.filename, settings.upload_dir, _max_upload_bytes(settings)
+        )
+        chunked_doc = await asyncio.to_thread(
+            chunker.chunk_document,
             parsed_doc,
             strategy=chunking_strategy,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
         )
         return chunked_doc
+    except FileTooLargeError:
+        raise _file_too_large(settings)
     except Exception as e:
         logger.exception(f"Error chunking document: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -263,7 +389,7 @@ async def process_example_pdf(
 
     This is useful for testing and demonstration purposes.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     # Path to the example PDF
     example_pdf_path = (
@@ -280,11 +406,12 @@ async def process_example_pdf(
     try:
         # Step 1: Parse document with Docling
         logger.info(f"Parsing example PDF: {example_pdf_path.name}")
-        parsed_doc = parser.parse_file(str(example_pdf_path))
+        parsed_doc = await asyncio.to_thread(parser.parse_file, str(example_pdf_path))
 
         # Step 2: Chunk with LlamaIndex
         logger.info(f"Chunking document with strategy: {chunking_strategy}")
-        chunked_doc = chunker.chunk_document(
+        chunked_doc = await asyncio.to_thread(
+            chunker.chunk_document,
             parsed_doc,
             strategy=chunking_strategy,
             chunk_size=chunk_size,
@@ -295,10 +422,12 @@ async def process_example_pdf(
         vector_db_stored = False
         if store_in_vector_db:
             logger.info("Storing chunks in vector DB")
-            vector_store.store_chunks(chunked_doc, collection_name)
+            await asyncio.to_thread(
+                vector_store.store_chunks, chunked_doc, collection_name
+            )
             vector_db_stored = True
 
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         return ProcessingResponse(
             success=True,
@@ -356,6 +485,7 @@ async def list_documents(
 
 @router.get(
     "/chunks",
+    response_model=StoredChunksResponse,
     summary="Get all chunks from the vector store",
     description="Get chunks with pagination, optionally filtered by document_id",
 )
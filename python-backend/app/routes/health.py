@@ -4,7 +4,8 @@ Health check routes
 
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.config import get_settings
 from app.models import HealthResponse
@@ -103,3 +104,13 @@ async def readiness():
 async def liveness():
     """Kubernetes-style liveness probe"""
     return {"status": "alive"}
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics",
+    description="Parse and embedding metrics in the Prometheus text format",
+)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -2,8 +2,10 @@
 RAG (Retrieval) routes - for Go backend to call
 """
 
+import asyncio
 import json
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import List, Optional
@@ -11,38 +13,31 @@ from typing import List, Optional
 import chromadb
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
-from sentence_transformers import SentenceTransformer
 
 from app.config import get_settings
+from app.services.embedder import get_embedder
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/rag", tags=["rag"])
 
 # Global instances (initialized on first use)
-_embedding_model = None
 _chroma_client = None
-
-
-def get_embedding_model():
-    global _embedding_model
-    if _embedding_model is None:
-        settings = get_settings()
-        logger.info(f"Loading embedding model: {settings.embedding_model}")
-        _embedding_model = SentenceTransformer(settings.embedding_model)
-    return _embedding_model
+_chroma_client_lock = threading.Lock()
 
 
 def get_chroma_client():
     global _chroma_client
     if _chroma_client is None:
-        settings = get_settings()
-        logger.info(
-            f"Connecting to ChromaDB at: {settings.chroma_host}:{settings.chroma_port}"
-        )
-        _chroma_client = chromadb.HttpClient(
-            host=settings.chroma_host,
-            port=settings.chroma_port,
-        )
+        with _chroma_client_lock:
+            if _chroma_client is None:
+                settings = get_settings()
+                logger.info(
+                    f"Connecting to ChromaDB at: {settings.chroma_host}:{settings.chroma_port}"
+                )
+                _chroma_client = chromadb.HttpClient(
+                    host=settings.chroma_host,
+                    port=settings.chroma_port,
+                )
     return _chroma_client
 
 
@@ -101,22 +96,23 @@ async def rag_search(request: RAGSearchRequest):
     Semantic search for RAG - returns chunks to feed to LLM.
     Called by Go backend before LLM call.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
-        model = get_embedding_model()
-        client = get_chroma_client()
+        # Model load, inference and Chroma I/O block - run them off the event loop
+        embedder = await asyncio.to_thread(get_embedder)
+        client = await asyncio.to_thread(get_chroma_client)
 
         # Get collection
         try:
-            collection = client.get_collection(request.collection)
+            collection = await asyncio.to_thread(client.get_collection, request.collection)
         except Exception:
             raise HTTPException(
                 status_code=404, detail=f"Collection '{request.collection}' not found"
             )
 
         # Embed query
-        query_embedding = model.encode([request.query])[0].tolist()
+        query_embedding = await asyncio.to_thread(embedder.embed_query, request.query)
 
         # Build filter
         where_filter = None
@@ -124,7 +120,8 @@ async def rag_search(request: RAGSearchRequest):
             where_filter = {"domain": request.filter_domain}
 
         # Search
-        results = collection.query(
+        results = await asyncio.to_thread(
+            collection.query,
             query_embeddings=[query_embedding],
             n_results=request.top_k,
             where=where_filter,
@@ -152,7 +149,7 @@ async def rag_search(request: RAGSearchRequest):
                     )
                 )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         return RAGSearchResponse(
             query=request.query,
@@ -216,12 +213,14 @@ async def load_chunks(request: LoadChunksRequest):
             f"Loading {len(chunks)} chunks into collection '{request.collection}'"
         )
 
-        model = get_embedding_model()
-        client = get_chroma_client()
+        embedder = await asyncio.to_thread(get_embedder)
+        client = await asyncio.to_thread(get_chroma_client)
 
         # Create/get collection
-        collection = client.get_or_create_collection(
-            name=request.collection, metadata={"hnsw:space": "cosine"}
+        collection = await asyncio.to_thread(
+            client.get_or_create_collection,
+            name=request.collection,
+            metadata={"hnsw:space": "cosine"},
         )
 
         # Prepare data
@@ -230,9 +229,11 @@ async def load_chunks(request: LoadChunksRequest):
         metadatas = []
 
         texts = [chunk["text"] for chunk in chunks]
-        embeddings = model.encode(texts, show_progress_bar=True)
+        embeddings = await asyncio.to_thread(
+            embedder.embed_texts, texts, show_progress_bar=True
+        )
 
-        for chunk, embedding in zip(chunks, embeddings):
+        for chunk in chunks:
             chunk_id = f"{request.doc_name}_{chunk['chunk_id']}"
             ids.append(chunk_id)
             documents.append(chunk["text"])
@@ -256,11 +257,12 @@ async def load_chunks(request: LoadChunksRequest):
             metadatas.append(metadata)
 
         # Add to collection
-        collection.add(
+        await asyncio.to_thread(
+            collection.add,
             ids=ids,
             documents=documents,
             metadatas=metadatas,
-            embeddings=[e.tolist() for e in embeddings],
+            embeddings=embeddings,
         )
 
         logger.info(f"Successfully loaded {len(chunks)} chunks")
@@ -2,6 +2,7 @@
 Vector search routes
 """
 
+import asyncio
 import logging
 import time
 from typing import Any, Dict, Optional
@@ -36,17 +37,19 @@ async def search_vectors(
     """
     Search for similar document chunks using semantic similarity.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
-        results = vector_store.search(
+        # Embedding and Chroma I/O block - run them off the event loop
+        results = await asyncio.to_thread(
+            vector_store.search,
             query=request.query,
             collection_name=request.collection_name,
             top_k=request.top_k,
             filter_metadata=request.filter_metadata,
         )
 
-        search_time = time.time() - start_time
+        search_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         return VectorSearchResponse(
             query=request.query,
@@ -76,21 +79,22 @@ async def quick_search(
     vector_store: VectorStoreService = Depends(get_vector_store),
 ):
     """Quick search endpoint for simple queries"""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     filter_metadata = None
     if document_id:
         filter_metadata = {"document_id": document_id}
 
     try:
-        results = vector_store.search(
+        results = await asyncio.to_thread(
+            vector_store.search,
             query=q,
             collection_name=collection,
             top_k=top_k,
             filter_metadata=filter_metadata,
         )
 
-        search_time = time.time() - start_time
+        search_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         return VectorSearchResponse(
             query=q,
@@ -2,8 +2,16 @@
 Services package - contains business logic for document processing
 """
 
-from .parser import DocumentParser
+from .parser import DocumentParser, FileTooLargeError, InvalidDocumentError
 from .chunker import DocumentChunker
+from .embedder import EmbedderService
 from .vector_store import VectorStoreService
 
-__all__ = ["DocumentParser", "DocumentChunker", "VectorStoreService"]
+__all__ = [
+    "DocumentParser",
+    "FileTooLargeError",
+    "InvalidDocumentError",
+    "DocumentChunker",
+    "EmbedderService",
+    "VectorStoreService",
+]
@@ -490,11 +490,13 @@ class DocumentChunker:
     ) -> List[TextChunk]:
         """Convert LlamaIndex nodes to our TextChunk format"""
         chunks = []
+        contents = [node.get_content() for node in nodes]
+        token_counts = self._estimate_tokens_batch(contents)
 
-        for idx, node in enumerate(nodes):
+        for idx, (node, content) in enumerate(zip(nodes, contents)):
             chunk = TextChunk(
                 id=node.node_id or f"{document_id}_chunk_{idx}",
-                text=node.get_content(),
+                text=content,
                 metadata={
                     **node.metadata,
                     "document_id": document_id,
@@ -503,7 +505,7 @@ class DocumentChunker:
                 start_char=node.start_char_idx,
                 end_char=node.end_char_idx,
                 chunk_index=idx,
-                token_count=self._estimate_tokens(node.get_content()),
+                token_count=token_counts[idx],
             )
             chunks.append(chunk)
 
@@ -514,10 +516,10 @@ class DocumentChunker:
     ) -> List[TextChunk]:
         """Create chunks from extracted tables"""
         chunks = []
+        table_texts = [table.get("markdown", str(table)) for table in tables]
+        token_counts = self._estimate_tokens_batch(table_texts)
 
-        for idx, table in enumerate(tables):
-            table_text = table.get("markdown", str(table))
-
+        for idx, (table, table_text) in enumerate(zip(tables, table_texts)):
             chunk = TextChunk(
                 id=f"{document_id}_table_{idx}",
                 text=table_text,
@@ -529,18 +531,27 @@ class DocumentChunker:
                 },
                 page_number=table.get("page"),
                 chunk_index=start_index + idx,
-                token_count=self._estimate_tokens(table_text),
+                token_count=token_counts[idx],
             )
             chunks.append(chunk)
 
         return chunks
 
-    def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count (rough approximation: ~4 chars per token)"""
+    def _estimate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts with a single tokenizer call"""
         tokenizer = get_tokenizer()
-        tokens = tokenizer(text)
-        # return len(text) // 4
-        return len(tokens)
+
+        # LlamaIndex's default tokenizer is partial(tiktoken_encoding.encode, ...);
+        # encode_batch tokenizes the whole list in parallel native threads.
+        # Reuse the partial's own keywords so both paths count identically
+        encoding = getattr(getattr(tokenizer, "func", None), "__self__", None)
+        if hasattr(encoding, "encode_batch") and not tokenizer.args:
+            return [
+                len(tokens)
+                for tokens in encoding.encode_batch(texts, **tokenizer.keywords)
+            ]
+
+        return [len(tokenizer(text)) for text in texts]
 
     def get_available_strategies(self) -> List[str]:
         """Get list of available chunking strategies"""
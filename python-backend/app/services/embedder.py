@@ -0,0 +1,339 @@
+"""
+Embedding Service using sentence-transformers
+Shares a single embedding model across the app and caches query embeddings
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+from sentence_transformers.models import Normalize
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    In-memory LRU cache of embeddings.
+    Hits are moved to the end; the least recently used entry is evicted first.
+    Keys are a 16-byte BLAKE2b digest of model + text, so long texts stay cheap.
+
+    With quantization="int8", vectors are stored as int8 plus a per-vector
+    float32 scale (~4x smaller) and dequantized on retrieval.
+
+    Lock-free: each OrderedDict operation is atomic under the GIL, and the
+    multi-step paths tolerate an entry vanishing under a concurrent caller.
+    The hits/misses/evictions counters are unsynchronized read-modify-writes,
+    so under concurrent use they are approximate and may undercount.
+    """
+
+    def __init__(self, max_entries: int = 1024, quantization: str = "none"):
+        """
+        Args:
+            max_entries: Maximum number of cached embeddings (0 disables caching)
+            quantization: "none" to store float32, or "int8"
+        """
+        if quantization not in ("none", "int8"):
+            raise ValueError(f"Unsupported cache quantization: {quantization}")
+
+        self.max_entries = max_entries
+        self.quantization = quantization
+        self._memory_cache: "OrderedDict[bytes, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _make_key(self, text: str, model: str) -> bytes:
+        """Raw 128-bit BLAKE2b digest of the model name and text"""
+        digest = blake2b(digest_size=16)
+        digest.update(model.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    @staticmethod
+    def _quantize(embedding: np.ndarray) -> Tuple[np.ndarray, np.float32]:
+        """Symmetric int8 quantization with one scale per vector"""
+        scale = np.float32(np.max(np.abs(embedding)) / 127.0)
+        if scale == 0:
+            return np.zeros(embedding.shape, dtype=np.int8), scale
+        quantized = np.round(embedding / scale).astype(np.int8)
+        return quantized, scale
+
+    @staticmethod
+    def _dequantize(quantized: np.ndarray, scale: np.float32) -> np.ndarray:
+        """Rebuild a float32 vector from its int8 form"""
+        return quantized.astype(np.float32) * scale
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        """Return the cached embedding, or None on a miss"""
+        key = self._make_key(text, model)
+        entry = self._memory_cache.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            self._memory_cache.move_to_end(key)
+        except KeyError:
+            pass  # Evicted by a concurrent set() between the lookup and here
+        self.hits += 1
+
+        if self.quantization == "int8":
+            return self._dequantize(*entry)
+        return entry
+
+    def set(self, text: str, model: str, embedding: np.ndarray) -> np.ndarray:
+        """
+        Store an embedding, evicting the least recently used entries if full.
+
+        Returns:
+            The embedding exactly as get() will return it (dequantized for int8),
+            so a miss and later hits hand out the same values
+        """
+        if self.max_entries <= 0:
+            return embedding
+
+        # One contiguous float32 block per entry, copied so the caller's array is
+        # untouched; read-only since hits hand out the same array to every caller
+        embedding = np.array(embedding, dtype=np.float32, order="C", copy=True)
+        embedding.flags.writeable = False
+
+        entry = self._quantize(embedding) if self.quantization == "int8" else embedding
+
+        key = self._make_key(text, model)
+        self._memory_cache[key] = entry
+        try:
+            self._memory_cache.move_to_end(key)
+        except KeyError:
+            pass  # Evicted by a concurrent set() already
+
+        while len(self._memory_cache) > self.max_entries:
+            try:
+                self._memory_cache.popitem(last=False)
+            except KeyError:
+                break  # Another thread emptied the cache first
+            self.evictions += 1
+
+        if self.quantization == "int8":
+            return self._dequantize(*entry)
+        return embedding
+
+    def stats(self) -> Dict[str, int]:
+        """Current size and hit/miss/eviction counters"""
+        return {
+            "entries": len(self._memory_cache),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Remove all cached embeddings"""
+        self._memory_cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._memory_cache)
+
+
+class EmbedderService:
+    """
+    Wraps the sentence-transformers model used for chunks and queries.
+    Use get_embedder() to share one loaded model across requests.
+    """
+
+    def __init__(self):
+        """Load the embedding model and set up the query cache"""
+        self.settings = get_settings()
+        self.model_name = self.settings.embedding_model
+
+        self.model = SentenceTransformer(self.model_name)
+
+        # float16 halves memory traffic and uses tensor cores; CPU stays float32
+        if self.settings.embedding_half_precision and self.model.device.type == "cuda":
+            self.model.half()
+            logger.info("Embedding model running in float16 on CUDA")
+
+        # Unit-length vectors make cosine similarity a plain dot product; skip
+        # the extra pass for models that already end in a Normalize layer
+        self._normalize = not any(isinstance(module, Normalize) for module in self.model)
+
+        self.cache = EmbeddingCache(
+            max_entries=self.settings.embedding_cache_size,
+            quantization=self.settings.embedding_cache_quantization.lower(),
+        )
+        self.total_dedup_savings = 0  # Texts skipped because they repeated in a batch
+
+        # Query misses currently being encoded, so concurrent duplicates can wait
+        self._inflight: Dict[str, "Future[np.ndarray]"] = {}
+        self._inflight_lock = threading.Lock()
+        self.coalesced_requests = 0
+
+        # Query latency totals; += is a read-modify-write, so update under the lock
+        self._metrics_lock = threading.Lock()
+        self._cached_ns_total = 0
+        self._cached_count = 0
+        self._uncached_ns_total = 0
+        self._uncached_count = 0
+
+        logger.info(f"Loaded embedding model: {self.model_name}")
+
+    def embed_texts(
+        self, texts: List[str], show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Embed a batch of texts (e.g. document chunks).
+        Identical texts are encoded once and the result is scattered back.
+
+        Args:
+            texts: Texts to embed
+            show_progress_bar: Whether to log encoding progress
+
+        Returns:
+            L2-normalized float32 array of shape (len(texts), dim)
+        """
+        # Map each distinct text to its first position, preserving order
+        unique_index: Dict[str, int] = {}
+        positions = [unique_index.setdefault(text, len(unique_index)) for text in texts]
+        unique_texts = list(unique_index)
+
+        embeddings = np.asarray(
+            self.model.encode(
+                unique_texts,
+                batch_size=self.settings.embedding_batch_size,
+                show_progress_bar=show_progress_bar,
+                normalize_embeddings=self._normalize,
+            ),
+            dtype=np.float32,
+        )
+
+        if len(unique_texts) == len(texts):
+            return embeddings
+
+        with self._metrics_lock:
+            self.total_dedup_savings += len(texts) - len(unique_texts)
+        return embeddings[positions]
+
+    def embed_query(self, text: str) -> np.ndarray:
+        """
+        Embed a single search query, served from the LRU cache when possible.
+        Texts longer than embedding_cache_max_chars skip the cache entirely.
+        Concurrent misses for the same text share one encode call.
+
+        Args:
+            text: Query text
+
+        Returns:
+            L2-normalized float32 array of shape (dim,)
+        """
+        start_ns = time.perf_counter_ns()
+        use_cache = len(text) <= self.settings.embedding_cache_max_chars
+
+        if use_cache:
+            embedding = self.cache.get(text, self.model_name)
+            if embedding is not None:
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                with self._metrics_lock:
+                    self._cached_ns_total += elapsed_ns
+                    self._cached_count += 1
+                return embedding
+
+        with self._inflight_lock:
+            future = self._inflight.get(text)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[text] = future
+            else:
+                self.coalesced_requests += 1
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            embedding = np.asarray(
+                self.model.encode(text, normalize_embeddings=self._normalize),
+                dtype=np.float32,
+            )
+            if use_cache:
+                embedding = self.cache.set(text, self.model_name, embedding)
+            future.set_result(embedding)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            with self._metrics_lock:
+                self._uncached_ns_total += elapsed_ns
+                self._uncached_count += 1
+            return embedding
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(text, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Cache, dedup and latency counters for tuning the query cache.
+
+        Returns:
+            Dictionary of counters and average query latencies
+        """
+        with self._metrics_lock:
+            cached_ns, cached_count = self._cached_ns_total, self._cached_count
+            uncached_ns, uncached_count = self._uncached_ns_total, self._uncached_count
+            dedup_savings = self.total_dedup_savings
+
+        avg_cached_ms = cached_ns / cached_count / 1e6 if cached_count else 0.0
+        avg_uncached_ms = uncached_ns / uncached_count / 1e6 if uncached_count else 0.0
+        cache_stats = self.cache.stats()
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+
+        return {
+            "model": self.model_name,
+            "total_cache_hits": cache_stats["hits"],
+            "total_cache_misses": cache_stats["misses"],
+            "cache_hit_rate": cache_stats["hits"] / lookups if lookups else 0.0,
+            "cache_entries": cache_stats["entries"],
+            "cache_max_entries": cache_stats["max_entries"],
+            "eviction_count": cache_stats["evictions"],
+            "total_dedup_savings": dedup_savings,
+            "coalesced_requests": self.coalesced_requests,
+            "cached_query_count": cached_count,
+            "uncached_query_count": uncached_count,
+            "cached_latency_sum_ns": cached_ns,
+            "uncached_latency_sum_ns": uncached_ns,
+            "avg_cached_latency_ms": round(avg_cached_ms, 4),
+            "avg_uncached_latency_ms": round(avg_uncached_ms, 4),
+            "speedup_factor": (
+                round(avg_uncached_ms / avg_cached_ms, 2) if avg_cached_ms else None
+            ),
+        }
+
+
+# Global instance (initialized on first use)
+_embedder: Optional[EmbedderService] = None
+_embedder_lock = threading.Lock()
+
+
+def get_embedder() -> EmbedderService:
+    """Get the shared embedder, loading the model on first use (thread-safe)"""
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = EmbedderService()
+    return _embedder
+
+
+def get_loaded_embedder() -> Optional[EmbedderService]:
+    """Return the shared embedder if it has been loaded, without loading it"""
+    return _embedder
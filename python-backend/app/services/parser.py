@@ -5,10 +5,12 @@ Handles PDF and document parsing with structure extraction
 
 import logging
 import os
+import threading
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import fitz  # PyMuPDF - fallback parser
 from docling.datamodel.base_models import InputFormat
@@ -16,10 +18,59 @@ from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.document_converter import DocumentConverter, PdfFormatOption
 
 from ..config import get_settings
+from ..metrics import PARSE_BYTES, PARSE_DURATION
 from ..models import DocumentMetadata, ParsedDocument
 
+try:
+    # Docling's PDF backend uses PDFium too; share its lock so the two never overlap
+    from docling.utils.locks import pypdfium2_lock as _pdfium_lock
+except ImportError:
+    _pdfium_lock = threading.Lock()
+
 logger = logging.getLogger(__name__)
 
+# PDFium and MuPDF are not thread-safe and parses run on worker threads, so
+# every pypdfium2/fitz call goes through one of these process-wide locks.
+# Locks are held per call, never across a yield.
+_fitz_lock = threading.Lock()
+
+# Uploads are copied to disk in blocks of this size, bounding memory per request
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+
+class FileTooLargeError(ValueError):
+    """Raised when an uploaded stream exceeds the configured size limit"""
+
+
+class InvalidDocumentError(ValueError):
+    """Raised when a file cannot be opened as the document type it claims to be"""
+
+
+# Global converter (initialized on first use)
+_converter: Optional[DocumentConverter] = None
+_converter_lock = threading.Lock()
+
+
+def get_converter() -> DocumentConverter:
+    """Get the shared Docling converter, loading its models on first use (thread-safe)"""
+    global _converter
+    if _converter is None:
+        with _converter_lock:
+            if _converter is None:
+                # Configure PDF pipeline options
+                pipeline_options = PdfPipelineOptions()
+                pipeline_options.do_ocr = True  # Enable OCR for scanned PDFs
+                pipeline_options.do_table_structure = True  # Extract table structure
+
+                # Initialize converter with PDF options
+                _converter = DocumentConverter(
+                    format_options={
+                        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+                    }
+                )
+                logger.info("Docling converter loaded")
+    return _converter
+
 
 class DocumentParser:
     """
@@ -28,20 +79,14 @@ class DocumentParser:
     """
 
     def __init__(self):
-        """Initialize the document parser with Docling converter"""
+        """Initialize the document parser (Docling is loaded on first use)"""
         self.settings = get_settings()
 
-        # Configure PDF pipeline options
-        pipeline_options = PdfPipelineOptions()
-        pipeline_options.do_ocr = True  # Enable OCR for scanned PDFs
-        pipeline_options.do_table_structure = True  # Extract table structure
-
-        # Initialize converter with PDF options
-        self.converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-            }
-        )
+        # File extension -> parser that bypasses Docling; everything else uses Docling.
+        # Markdown stays on Docling, which extracts its tables and heading title.
+        self._format_parsers = {
+            "txt": self._parse_plaintext,
+        }
 
         if self.settings.max_pdf_pages > 0:
             logger.info(
@@ -50,6 +95,11 @@ class DocumentParser:
 
         logger.info("DocumentParser initialized with Docling")
 
+    @property
+    def converter(self) -> DocumentConverter:
+        """Shared Docling converter, loaded lazily so text-only parses never load it"""
+        return get_converter()
+
     def parse_file(self, file_path: str) -> ParsedDocument:
         """
         Parse a document file and extract content.
@@ -66,6 +116,7 @@ class DocumentParser:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         logger.info(f"Parsing document: {file_path}")
+        start_ns = time.perf_counter_ns()
 
         # Get file metadata
         file_stats = file_path.stat()
@@ -81,43 +132,55 @@ class DocumentParser:
         title: Optional[str] = None
         extraction_method = "docling"
 
-        # Try Docling first, fall back to PyMuPDF if it fails
-        try:
-            if self.settings.max_pdf_pages > 0:
-                result = self.converter.convert(
-                    str(file_path),
-                    max_num_pages=self.settings.max_pdf_pages,
-                    raises_on_error=False,
-                )
-            else:
-                result = self.converter.convert(str(file_path), raises_on_error=False)
-
-            # Check if Docling succeeded
-            if result.status.name == "SUCCESS" and result.document:
-                doc = result.document
-                raw_text = doc.export_to_text()
-                markdown_text = doc.export_to_markdown()
-                tables = self._extract_tables(doc)
-                figures = self._extract_figures(doc)
-                pages = self._extract_pages(doc)
-                page_count = len(pages) if pages else None
-                title = self._extract_title_from_docling(doc)
-                extraction_method = "docling"
-                logger.info("Successfully parsed with Docling")
-            else:
+        # Formats that need no layout analysis skip Docling entirely
+        format_parser = self._format_parsers.get(file_type)
+
+        if format_parser is not None:
+            raw_text, markdown_text, tables, figures, pages, page_count, title = (
+                format_parser(file_path)
+            )
+            extraction_method = "plaintext"
+        else:
+            # Try Docling first, fall back to PyMuPDF if it fails
+            try:
+                if self.settings.max_pdf_pages > 0:
+                    result = self.converter.convert(
+                        str(file_path),
+                        max_num_pages=self.settings.max_pdf_pages,
+                        raises_on_error=False,
+                    )
+                else:
+                    result = self.converter.convert(str(file_path), raises_on_error=False)
+
+                # Check if Docling succeeded
+                if result.status.name == "SUCCESS" and result.document:
+                    doc = result.document
+                    raw_text = doc.export_to_text()
+                    markdown_text = doc.export_to_markdown()
+                    tables = self._extract_tables(doc)
+                    figures = self._extract_figures(doc)
+                    pages = self._extract_pages(doc)
+                    page_count = len(pages) if pages else None
+                    title = self._extract_title_from_docling(doc)
+                    extraction_method = "docling"
+                    logger.info("Successfully parsed with Docling")
+                else:
+                    logger.warning(
+                        f"Docling failed with status {result.status}, "
+                        f"falling back to {self.settings.pdf_fallback_backend}"
+                    )
+                    raw_text, markdown_text, tables, figures, pages, page_count, title = (
+                        self._parse_with_fallback(file_path)
+                    )
+                    extraction_method = self.settings.pdf_fallback_backend.lower()
+            except Exception as e:
                 logger.warning(
-                    f"Docling failed with status {result.status}, falling back to PyMuPDF"
+                    f"Docling error: {e}, falling back to {self.settings.pdf_fallback_backend}"
                 )
                 raw_text, markdown_text, tables, figures, pages, page_count, title = (
-                    self._parse_with_pymupdf(file_path)
+                    self._parse_with_fallback(file_path)
                 )
-                extraction_method = "pymupdf"
-        except Exception as e:
-            logger.warning(f"Docling error: {e}, falling back to PyMuPDF")
-            raw_text, markdown_text, tables, figures, pages, page_count, title = (
-                self._parse_with_pymupdf(file_path)
-            )
-            extraction_method = "pymupdf"
+                extraction_method = self.settings.pdf_fallback_backend.lower()
 
         # Create metadata
         metadata = DocumentMetadata(
@@ -144,6 +207,8 @@ class DocumentParser:
             figures=figures,
         )
 
+        self._record_parse(extraction_method, start_ns, file_stats.st_size)
+
         logger.info(
             f"Successfully parsed document: {file_path.name}, "
             f"{len(raw_text)} chars, {len(tables)} tables, {len(figures)} figures"
@@ -151,6 +216,130 @@ class DocumentParser:
 
         return parsed_doc
 
+    def parse_text_fast(self, file_path: str) -> ParsedDocument:
+        """
+        Extract plain text from a PDF with PyMuPDF only.
+        Skips Docling's layout and table models, so no pages, tables or
+        figures are returned.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            ParsedDocument with raw and markdown text
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        logger.info(f"Parsing text only: {file_path}")
+        start_ns = time.perf_counter_ns()
+
+        file_stats = file_path.stat()
+        raw_text, markdown_text, _, _, _, page_count, title = self._parse_with_pymupdf(
+            file_path
+        )
+        self._record_parse("pymupdf", start_ns, file_stats.st_size)
+
+        metadata = DocumentMetadata(
+            filename=file_path.name,
+            file_type=file_path.suffix.lower().lstrip("."),
+            page_count=page_count,
+            title=title,
+            author=None,
+            created_at=datetime.fromtimestamp(file_stats.st_ctime),
+            file_size_bytes=file_stats.st_size,
+            extraction_method="pymupdf",
+        )
+
+        return ParsedDocument(
+            document_id=str(uuid.uuid4()),
+            metadata=metadata,
+            raw_text=raw_text,
+            markdown_text=markdown_text,
+        )
+
+    def _record_parse(self, method: str, start_ns: int, size_bytes: int):
+        """Record parse latency and size in the Prometheus metrics"""
+        PARSE_DURATION.labels(method=method).observe(
+            (time.perf_counter_ns() - start_ns) / 1e9
+        )
+        PARSE_BYTES.labels(method=method).inc(size_bytes)
+
+    def _parse_plaintext(
+        self, file_path: Path
+    ) -> Tuple[str, str, List[Dict], List[Dict], List[Dict], Optional[int], Optional[str]]:
+        """
+        Read a plain text file as-is.
+        Returns: (raw_text, markdown_text, tables, figures, pages, page_count, title)
+        """
+        text = file_path.read_text(encoding="utf-8", errors="replace")
+        return text, text, [], [], [], None, None
+
+    def _parse_with_fallback(
+        self, file_path: Path
+    ) -> Tuple[str, str, List[Dict], List[Dict], List[Dict], int, Optional[str]]:
+        """
+        Run the configured fallback text extractor (pdf_fallback_backend).
+        Returns: (raw_text, markdown_text, tables, figures, pages, page_count, title)
+        """
+        backend = self.settings.pdf_fallback_backend.lower()
+
+        if backend == "pypdfium2":
+            return self._parse_with_pypdfium2(file_path)
+        if backend == "pymupdf":
+            return self._parse_with_pymupdf(file_path)
+
+        raise ValueError(
+            f"Unknown pdf_fallback_backend: {backend}. Use 'pymupdf' or 'pypdfium2'."
+        )
+
+    def _parse_with_pypdfium2(
+        self, file_path: Path
+    ) -> Tuple[str, str, List[Dict], List[Dict], List[Dict], int, Optional[str]]:
+        """
+        Fallback parser using PDFium's native text extractor.
+        Permissively licensed alternative to PyMuPDF (AGPL).
+        Returns: (raw_text, markdown_text, tables, figures, pages, page_count, title)
+        """
+        import pypdfium2 as pdfium  # Optional dependency, only needed for this backend
+
+        logger.info(f"Parsing with pypdfium2: {file_path}")
+
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(str(file_path))
+            page_count = self._pages_to_process(len(pdf))
+
+            raw_text_parts = []
+            markdown_parts = []
+            pages = []
+
+            try:
+                for i in range(page_count):
+                    page = pdf[i]
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+
+                    raw_text_parts.append(page_text)
+                    markdown_parts.append(f"## Page {i + 1}\n\n{page_text}")
+                    pages.append({"page_number": i + 1, "text": page_text})
+
+                title = pdf.get_metadata_dict().get("Title") or None
+            finally:
+                pdf.close()
+
+        raw_text = "\n\n".join(raw_text_parts)
+        markdown_text = "\n\n".join(markdown_parts)
+
+        logger.info(f"pypdfium2 extracted {len(raw_text)} chars from {page_count} pages")
+
+        return raw_text, markdown_text, [], [], pages, page_count, title
+
     def _parse_with_pymupdf(
         self, file_path: Path
     ) -> Tuple[str, str, List[Dict], List[Dict], List[Dict], int, Optional[str]]:
@@ -160,32 +349,31 @@ class DocumentParser:
         """
         logger.info(f"Parsing with PyMuPDF: {file_path}")
 
-        doc = fitz.open(str(file_path))
-        max_pages = self.settings.max_pdf_pages
-        total_pages = len(doc)
-        page_count = min(total_pages, max_pages) if max_pages > 0 else total_pages
+        with _fitz_lock:
+            doc = fitz.open(str(file_path))
+            page_count = self._pages_to_process(len(doc))
 
-        raw_text_parts = []
-        markdown_parts = []
-        pages = []
+            raw_text_parts = []
+            markdown_parts = []
+            pages = []
 
-        for i in range(page_count):
-            page = doc[i]
-            page_text = page.get_text()
-            raw_text_parts.append(page_text)
+            for i in range(page_count):
+                page = doc[i]
+                page_text = page.get_text()
+                raw_text_parts.append(page_text)
 
-            # Simple markdown conversion
-            markdown_parts.append(f"## Page {i + 1}\n\n{page_text}")
+                # Simple markdown conversion
+                markdown_parts.append(f"## Page {i + 1}\n\n{page_text}")
 
-            pages.append({"page_number": i + 1, "text": page_text})
+                pages.append({"page_number": i + 1, "text": page_text})
 
-        # Try to extract title from PDF metadata
-        title = None
-        pdf_metadata = doc.metadata
-        if pdf_metadata and pdf_metadata.get("title"):
-            title = pdf_metadata["title"]
+            # Try to extract title from PDF metadata
+            title = None
+            pdf_metadata = doc.metadata
+            if pdf_metadata and pdf_metadata.get("title"):
+                title = pdf_metadata["title"]
 
-        doc.close()
+            doc.close()
 
         raw_text = "\n\n".join(raw_text_parts)
         markdown_text = "\n\n".join(markdown_parts)
@@ -223,6 +411,149 @@ class DocumentParser:
             if temp_path.exists():
                 temp_path.unlink()
 
+    def parse_stream(
+        self,
+        file_obj: BinaryIO,
+        filename: str,
+        upload_dir: str,
+        max_bytes: int = 0,
+        text_only: bool = False,
+    ) -> ParsedDocument:
+        """
+        Parse a document from a binary stream (uploaded file).
+        The stream is copied to disk in UPLOAD_CHUNK_BYTES blocks, so large
+        uploads are never held in memory in full.
+
+        Args:
+            file_obj: Readable binary stream positioned at the start of the file
+            filename: Original filename
+            upload_dir: Directory to temporarily save the file
+            max_bytes: Reject the upload once it exceeds this size (0 = no limit)
+            text_only: Use parse_text_fast() instead of the Docling pipeline
+
+        Returns:
+            ParsedDocument with extracted content
+
+        Raises:
+            FileTooLargeError: If the stream is larger than max_bytes
+        """
+        temp_path = self.save_stream(file_obj, filename, upload_dir, max_bytes)
+
+        try:
+            if text_only:
+                return self.parse_text_fast(str(temp_path))
+            return self.parse_file(str(temp_path))
+        finally:
+            # Clean up temp file
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def save_stream(
+        self,
+        file_obj: BinaryIO,
+        filename: str,
+        upload_dir: str,
+        max_bytes: int = 0,
+    ) -> Path:
+        """
+        Copy a binary stream to a temp file in UPLOAD_CHUNK_BYTES blocks.
+        The caller is responsible for deleting the returned file.
+
+        Args:
+            file_obj: Readable binary stream positioned at the start of the file
+            filename: Original filename
+            upload_dir: Directory to save the file in
+            max_bytes: Reject the upload once it exceeds this size (0 = no limit)
+
+        Returns:
+            Path of the temp file
+
+        Raises:
+            FileTooLargeError: If the stream is larger than max_bytes
+        """
+        temp_path = Path(upload_dir) / f"temp_{uuid.uuid4()}_{filename}"
+
+        try:
+            copied = 0
+            with open(temp_path, "wb") as temp_file:
+                for block in iter(lambda: file_obj.read(UPLOAD_CHUNK_BYTES), b""):
+                    copied += len(block)
+                    if max_bytes and copied > max_bytes:
+                        raise FileTooLargeError(
+                            f"{filename} exceeds the {max_bytes} byte upload limit"
+                        )
+                    temp_file.write(block)
+        except BaseException:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+        return temp_path
+
+    def _pages_to_process(self, total_pages: int) -> int:
+        """Apply the max_pdf_pages limit (0 = no limit) to a document's page count"""
+        max_pages = self.settings.max_pdf_pages
+        return min(total_pages, max_pages) if max_pages > 0 else total_pages
+
+    def get_pdf_page_count(self, file_path: str) -> int:
+        """
+        Open a PDF with PyMuPDF and count the pages that will be extracted.
+        Used to reject unreadable files before a streaming response starts.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            Page count, capped at max_pdf_pages when that limit is set
+
+        Raises:
+            InvalidDocumentError: If the file cannot be opened as a PDF or has no pages
+        """
+        try:
+            with _fitz_lock:
+                with fitz.open(str(file_path)) as doc:
+                    total_pages = len(doc)
+        except Exception as e:
+            # The fitz message includes the server-side temp path; keep it in the log
+            logger.warning(f"Could not open PDF {file_path}: {e}")
+            raise InvalidDocumentError("File is not a readable PDF") from e
+
+        if total_pages == 0:
+            raise InvalidDocumentError("PDF has no pages")
+
+        return self._pages_to_process(total_pages)
+
+    def iter_pdf_pages(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield PDF pages one at a time with PyMuPDF.
+        Only the current page's text is held in memory; max_pdf_pages applies.
+        Parse metrics are recorded once the last page has been yielded.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Yields:
+            Dictionary with page_number and text for each page
+        """
+        start_ns = time.perf_counter_ns()
+
+        with _fitz_lock:
+            doc = fitz.open(str(file_path))
+
+        try:
+            with _fitz_lock:
+                page_count = self._pages_to_process(len(doc))
+
+            for i in range(page_count):
+                with _fitz_lock:
+                    page_text = doc[i].get_text()
+                yield {"page_number": i + 1, "text": page_text}
+
+            self._record_parse("pymupdf", start_ns, Path(file_path).stat().st_size)
+        finally:
+            with _fitz_lock:
+                doc.close()
+
     def _extract_tables(self, doc) -> List[Dict[str, Any]]:
         """Extract tables from the Docling document"""
         tables = []
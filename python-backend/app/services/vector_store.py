@@ -8,7 +8,6 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import chromadb
-from sentence_transformers import SentenceTransformer
 
 from ..config import get_settings
 from ..models import (
@@ -16,6 +15,7 @@ from ..models import (
     TextChunk,
     VectorSearchResult,
 )
+from .embedder import get_embedder
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +30,8 @@ class VectorStoreService:
         """Initialize the vector store service"""
         self.settings = get_settings()
 
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer(self.settings.embedding_model)
-        logger.info(f"Loaded embedding model: {self.settings.embedding_model}")
+        # Shared embedding model (loaded once per process)
+        self.embedder = get_embedder()
 
         # Initialize ChromaDB HTTP client (connects to ChromaDB server)
         self.chroma_client = chromadb.HttpClient(
@@ -74,13 +73,12 @@ class VectorStoreService:
         ids = []
         documents = []
         metadatas = []
-        embeddings = []
 
-        # Generate embeddings for all chunks
+        # Generate embeddings for all chunks (float32 array of shape (N, D))
         texts = [chunk.text for chunk in chunked_doc.chunks]
-        chunk_embeddings = self.embedding_model.encode(texts, show_progress_bar=True)
+        chunk_embeddings = self.embedder.embed_texts(texts, show_progress_bar=True)
 
-        for chunk, embedding in zip(chunked_doc.chunks, chunk_embeddings):
+        for chunk in chunked_doc.chunks:
             ids.append(chunk.id)
             documents.append(chunk.text)
 
@@ -104,11 +102,13 @@ class VectorStoreService:
                     metadata[key] = value
 
             metadatas.append(metadata)
-            embeddings.append(embedding.tolist())
 
-        # Add to collection
+        # Add to collection (Chroma accepts the float32 array directly)
         collection.add(
-            ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            embeddings=chunk_embeddings,
         )
 
         logger.info(f"Stored {len(ids)} chunks in collection '{collection.name}'")
@@ -137,7 +137,7 @@ class VectorStoreService:
         collection = self.get_or_create_collection(collection_name)
 
         # Generate query embedding
-        query_embedding = self.embedding_model.encode([query])[0].tolist()
+        query_embedding = self.embedder.embed_query(query)
 
         # Build where clause if filter provided
         where = None
@@ -1,6 +1,7 @@
 """
 Test script for the DocumentChunker with metadata extraction
 Tests the new title and questions extraction features via LM Studio
+Run with: python -m app.test_chunker (after pip install -e .)
 """
 
 import json
@@ -8,9 +9,6 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-# Add the app directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from app.services.chunker import DocumentChunker
 from app.services.parser import DocumentParser
 from app.services.vector_store import VectorStoreService
@@ -1,18 +1,10 @@
 # python-backend/beir_benchmark.py
+# Requires the backend to be installed: pip install -e python-backend/
 import argparse
 import logging
-import os
 import pathlib
-import sys
 from typing import Dict
 
-# Add the grandparent directory (python-backend/) to sys.path
-script_dir = os.path.dirname(__file__)  # benchmarking_testing/
-parent_dir = os.path.dirname(script_dir)  # python-backend/
-sys.path.insert(0, parent_dir)
-
-# Import from your existing app
-sys.path.append("app")
 # BEIR imports
 from beir import util
 from beir.datasets.data_loader import GenericDataLoader
@@ -45,7 +37,7 @@ class IsolatedChromaRetriever:
             metadatas.append({"title": title, "doc_id": doc_id})
 
         # Use your embedding model
-        embeddings = self.vector_store.embedding_model.encode(documents).tolist()
+        embeddings = self.vector_store.embedder.embed_texts(documents)
 
         self.collection.add(
             ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings
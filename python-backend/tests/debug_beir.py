@@ -1,15 +1,9 @@
 # python-backend/tests/debug_beir.py
-import os
-import sys
+# Requires the backend to be installed: pip install -e python-backend/
 
 print("Script started")
 
 try:
-    # Add the parent directory of tests/ (i.e., python-backend/) to sys.path
-    script_dir = os.path.dirname(__file__)  # tests/
-    parent_dir = os.path.dirname(script_dir)  # python-backend/
-    sys.path.insert(0, parent_dir)
-
     from app.config import get_settings
 
     print("Config import successful")
@@ -0,0 +1,120 @@
+"""
+Tests for the embedding LRU cache
+Run with: pytest tests/ (after pip install -e .)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+embedder = pytest.importorskip("app.services.embedder")
+
+
+def _unit_vector(dim: int = 384, seed: int = 0) -> "np.ndarray":
+    rng = np.random.default_rng(seed)
+    vector = rng.standard_normal(dim).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class _FakeModel:
+    """Stands in for SentenceTransformer: fixed output, no Normalize layer"""
+
+    device = SimpleNamespace(type="cpu")
+
+    def __init__(self, model_name: str):
+        self.encode_calls = 0
+
+    def __iter__(self):
+        return iter(())
+
+    def encode(self, texts, **kwargs):
+        self.encode_calls += 1
+        return np.array([2.0, 1.0, -2.0], dtype=np.float32)
+
+
+def test_cache_eviction_lru():
+    cache = embedder.EmbeddingCache(max_entries=2)
+    cache.set("a", "model", _unit_vector(seed=1))
+    cache.set("b", "model", _unit_vector(seed=2))
+
+    assert cache.get("a", "model") is not None  # "b" is now least recently used
+    cache.set("c", "model", _unit_vector(seed=3))
+
+    assert cache.get("b", "model") is None
+    assert cache.get("a", "model") is not None
+    assert cache.get("c", "model") is not None
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_set_does_not_freeze_callers_array():
+    cache = embedder.EmbeddingCache(max_entries=8)
+    vector = _unit_vector()
+
+    cache.set("query", "model", vector)
+    vector[0] = 1.0  # Would raise if set() had frozen the caller's array
+
+    assert cache.get("query", "model")[0] != 1.0
+    assert not cache.get("query", "model").flags.writeable
+
+
+def test_int8_cache_roundtrip():
+    cache = embedder.EmbeddingCache(max_entries=8, quantization="int8")
+    vector = _unit_vector()
+
+    stored = cache.set("query", "model", vector)
+    hit = cache.get("query", "model")
+
+    assert hit.dtype == np.float32
+    np.testing.assert_array_equal(stored, hit)
+    cosine = float(np.dot(vector, hit) / (np.linalg.norm(vector) * np.linalg.norm(hit)))
+    assert cosine > 0.9995
+
+
+def test_int8_cache_zero_vector():
+    cache = embedder.EmbeddingCache(max_entries=8, quantization="int8")
+
+    cache.set("empty", "model", np.zeros(4, dtype=np.float32))
+
+    np.testing.assert_array_equal(cache.get("empty", "model"), np.zeros(4))
+
+
+def _fake_service(monkeypatch, quantization: str = "none"):
+    """EmbedderService backed by _FakeModel and in-test settings"""
+    settings = SimpleNamespace(
+        embedding_model="fake-model",
+        embedding_half_precision=False,
+        embedding_cache_size=8,
+        embedding_cache_max_chars=512,
+        embedding_cache_quantization=quantization,
+        embedding_batch_size=32,
+    )
+    monkeypatch.setattr(embedder, "get_settings", lambda: settings)
+    monkeypatch.setattr(embedder, "SentenceTransformer", _FakeModel)
+    return embedder.EmbedderService()
+
+
+def test_int8_query_miss_matches_hit(monkeypatch):
+    service = _fake_service(monkeypatch, quantization="int8")
+
+    miss = service.embed_query("same query")
+    hit = service.embed_query("same query")
+
+    assert service.model.encode_calls == 1
+    np.testing.assert_array_equal(miss, hit)
+
+
+def test_get_metrics_counts_hits_and_misses(monkeypatch):
+    service = _fake_service(monkeypatch)
+
+    service.embed_query("query")  # Miss
+    service.embed_query("query")  # Hit
+    metrics = service.get_metrics()
+
+    assert metrics["uncached_query_count"] == 1
+    assert metrics["cached_query_count"] == 1
+    assert metrics["total_cache_misses"] == 1
+    assert metrics["total_cache_hits"] == 1
+    assert metrics["uncached_latency_sum_ns"] > 0
+    assert metrics["cached_latency_sum_ns"] > 0
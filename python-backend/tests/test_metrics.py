@@ -0,0 +1,42 @@
+"""
+Tests for the Prometheus /metrics endpoint
+Run with: pytest tests/ (after pip install -e .)
+"""
+
+import pytest
+
+testclient = pytest.importorskip("fastapi.testclient")
+main = pytest.importorskip("app.main")
+
+
+def _parse_count(client, method: str) -> float:
+    """Read parse_duration_seconds_count for one extraction method"""
+    prefix = f'parse_duration_seconds_count{{method="{method}"}}'
+    for line in client.get("/metrics").text.splitlines():
+        if line.startswith(prefix):
+            return float(line.split()[-1])
+    return 0.0
+
+
+def test_metrics_endpoint_is_served_without_redirect():
+    client = testclient.TestClient(main.app)
+
+    response = client.get("/metrics", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+
+def test_metrics_endpoint_exposes_parse_counter():
+    client = testclient.TestClient(main.app)
+    before = _parse_count(client, "plaintext")
+
+    # .txt takes the plaintext path, so no Docling models are loaded
+    response = client.post(
+        "/documents/parse",
+        files={"file": ("notes.txt", b"hello metrics", "text/plain")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["metadata"]["extraction_method"] == "plaintext"
+    assert _parse_count(client, "plaintext") == before + 1